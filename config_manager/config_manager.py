@@ -1,9 +1,147 @@
+import hashlib
 import json
 import os
-from typing import Any, Dict, List
+import re
+import secrets
+import stat
+from concurrent.futures import Executor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson не обязателен
+    orjson = None  # type: ignore[assignment]
+
+
+# Серия из 19+ цифр может быть целым вне 64-битного диапазона, которое orjson
+# молча превращает во float; такие документы разбирает стандартный json
+_LONG_NUMBER_RE = re.compile(rb"\d{19}")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Разбирает JSON, используя orjson при его наличии.
+
+    Результат совпадает со стандартным json: документы с NaN/Infinity,
+    переполняющими float числами или длинными целыми разбираются им.
+    """
+    if orjson is not None and not _LONG_NUMBER_RE.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Сериализует объект в JSON (UTF-8, отступ 2), используя orjson при его наличии."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            # Например, целые вне 64-битного диапазона
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _copy_json(obj: Any) -> Any:
+    """Копирует разобранный JSON: новые dict и list, скаляры разделяются.
+
+    Значения из JSON неизменяемы, кроме dict и list, поэтому такой копии
+    достаточно, и она в несколько раз дешевле copy.deepcopy.
+    """
+    obj_type = type(obj)
+    if obj_type is dict:
+        return {key: _copy_json(value) for key, value in obj.items()}
+    if obj_type is list:
+        return [_copy_json(value) for value in obj]
+    return obj
+
+
+@lru_cache(maxsize=128)
+def _read_cached(cfg_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Читает и разбирает JSON файл конфигурации с кэшированием.
+
+    Ключ кэша включает время модификации и размер файла, поэтому
+    измененный файл будет прочитан заново. Возвращаемый словарь общий
+    для всех вызовов и не должен изменяться.
+    """
+    cfg: Dict[str, Any] = _json_loads(Path(cfg_path).read_bytes())
+    return cfg
+
+
+def _fsync_dir(path: str) -> None:
+    """Сбрасывает на диск запись директории (нужно после os.replace). Только POSIX."""
+    if os.name != "posix":
+        return
+    dir_fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def _open_temp_file(target: str) -> Tuple[int, str]:
+    """Создает уникальный временный файл рядом с target и открывает его на запись.
+
+    Права 0o666 передаются в os.open, поэтому ядро само применяет текущий umask.
+    """
+    parent, name = os.path.split(target)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        tmp_path = os.path.join(parent, f".{name}.{secrets.token_hex(8)}.tmp")
+        try:
+            return os.open(tmp_path, flags, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+# Секции конфигурации с директориями, монтируемыми в Docker-контейнер
+_DIR_TYPES = ("data_dirs", "system_dirs")
+
+# Конфигурация по умолчанию строится один раз при импорте модуля
+_DEFAULT_CFG: Dict[str, Any] = {
+    "user_config": "user_config_prompt_eval.csv",
+    "vlm_base": "vlmhyperbench/vlm_base.csv",
+    "data_dirs": {
+        "datasets": "vlmhyperbench/data_dirs/Datasets",
+        "model_answers": "vlmhyperbench/data_dirs/ModelsAnswers",
+        "model_metrics": "vlmhyperbench/data_dirs/ModelsMetrics",
+        "prompt_collections": "vlmhyperbench/data_dirs/PromptCollections",
+        "system_prompts": "vlmhyperbench/data_dirs/SystemPrompts",
+        "reports": "vlmhyperbench/data_dirs/Reports",
+    },
+    "system_dirs": {
+        "cfg": "vlmhyperbench/system_dirs/cfg",
+        "bench_stages": "vlmhyperbench/system_dirs/bench_stages",
+        "model_cache": "vlmhyperbench/system_dirs/model_cache",
+        "wheels": "vlmhyperbench/system_dirs/wheels",
+    },
+    "eval_docker_img": "ghcr.io/vlmhyperbenchteam/metric-evaluator:python3.10-slim_v0.1.0",
+}
+
+_DEFAULT_CFG["benchmark_run_cfg"] = os.path.join(
+    _DEFAULT_CFG["system_dirs"]["cfg"], "BenchmarkRunConfig.json"
+)
+_DEFAULT_CFG["vlm_run_packages"] = os.path.join(
+    _DEFAULT_CFG["system_dirs"]["cfg"], "vlm_run_requirements.txt"
+)
+_DEFAULT_CFG["eval_run_packages"] = os.path.join(
+    _DEFAULT_CFG["system_dirs"]["cfg"], "eval_run_requirements.txt"
+)
 
 
 class ConfigManager:
+    __slots__ = (
+        "cfg_path",
+        "cfg",
+        "_mappings_cache",
+        "_last_write",
+    )
+
     def __init__(self, cfg_path: str, default: bool = False) -> None:
         """Инициализирует ConfigManager управляющий конфигурацией VLMHyperbecnh.
 
@@ -22,8 +160,34 @@ class ConfigManager:
         else:
             self.cfg = self.read_config(cfg_path)
 
-        self.volumes = self.get_volumes()
-        self.cfg_container = self.get_container_config()
+        self._mappings_cache: Optional[Tuple[Dict[str, str], Dict[str, Any]]] = None
+        # (хэш содержимого, st_mtime_ns, st_size) последнего записанного файла
+        self._last_write: Optional[Tuple[bytes, int, int]] = None
+
+    @property
+    def _mappings(self) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """Маппинг томов и конфигурация контейнера, построенные за один проход."""
+        if self._mappings_cache is None:
+            self._mappings_cache = self._build_mappings()
+        return self._mappings_cache
+
+    @property
+    def volumes(self) -> Dict[str, str]:
+        """Маппинг директорий для Docker-контейнера (вычисляется при первом обращении)."""
+        return self._mappings[0]
+
+    @volumes.setter
+    def volumes(self, value: Dict[str, str]) -> None:
+        self._mappings_cache = (value, self._mappings[1])
+
+    @property
+    def cfg_container(self) -> Dict[str, Any]:
+        """Конфигурация с путями внутри контейнера (вычисляется при первом обращении)."""
+        return self._mappings[1]
+
+    @cfg_container.setter
+    def cfg_container(self, value: Dict[str, Any]) -> None:
+        self._mappings_cache = (self._mappings[0], value)
 
     @staticmethod
     def get_default_config() -> Dict[str, Any]:
@@ -39,49 +203,68 @@ class ConfigManager:
             >>> print(default_cfg['data_dirs']['vlm_base'])
             'vlmhyperbench/vlm_base.csv'
         """
-        default_cfg = {
-            "user_config": "user_config_prompt_eval.csv",
-            "vlm_base": "vlmhyperbench/vlm_base.csv",
-            "data_dirs": {
-                "datasets": "vlmhyperbench/data_dirs/Datasets",
-                "model_answers": "vlmhyperbench/data_dirs/ModelsAnswers",
-                "model_metrics": "vlmhyperbench/data_dirs/ModelsMetrics",
-                "prompt_collections": "vlmhyperbench/data_dirs/PromptCollections",
-                "system_prompts": "vlmhyperbench/data_dirs/SystemPrompts",
-                "reports": "vlmhyperbench/data_dirs/Reports",
-            },
-            "system_dirs": {
-                "cfg": "vlmhyperbench/system_dirs/cfg",
-                "bench_stages": "vlmhyperbench/system_dirs/bench_stages",
-                "model_cache": "vlmhyperbench/system_dirs/model_cache",
-                "wheels": "vlmhyperbench/system_dirs/wheels",
-            },
-            "eval_docker_img": "ghcr.io/vlmhyperbenchteam/metric-evaluator:python3.10-slim_v0.1.0",
+        # Вложены только секции директорий, поэтому достаточно копировать их явно
+        return {
+            **_DEFAULT_CFG,
+            "data_dirs": dict(_DEFAULT_CFG["data_dirs"]),
+            "system_dirs": dict(_DEFAULT_CFG["system_dirs"]),
         }
 
-        default_cfg["benchmark_run_cfg"] = os.path.join(
-            default_cfg["system_dirs"]["cfg"], "BenchmarkRunConfig.json"
-        )
-        default_cfg["vlm_run_packages"] = os.path.join(
-            default_cfg["system_dirs"]["cfg"], "vlm_run_requirements.txt"
-        )
-        default_cfg["eval_run_packages"] = os.path.join(
-            default_cfg["system_dirs"]["cfg"], "eval_run_requirements.txt"
-        )
-
-        return default_cfg
-
     def write_config(self) -> None:
         """Сохраняет конфигурацию в JSON файл.
 
         Сохраняет текущее состояние cfg в файл с отступами и поддержкой Unicode.
-        Использует путь, указанный в self.cfg_path.
+        Использует путь, указанный в self.cfg_path. Запись атомарна: данные
+        пишутся во временный файл, который затем заменяет исходный (права
+        доступа существующего файла сохраняются, симлинк не заменяется).
+        Если содержимое не изменилось с последней записи и файл на диске
+        не трогали, запись пропускается. Отсутствующие родительские
+        директории создаются автоматически.
 
         Raises:
             IOError: При ошибках записи файла
         """
-        with open(self.cfg_path, "w", encoding="utf-8") as f:
-            json.dump(self.cfg, f, ensure_ascii=False, indent=4)
+        data = _json_dumps(self.cfg)
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if self._last_write is not None and self._last_write[0] == digest:
+            try:
+                st = os.stat(self.cfg_path)
+            except FileNotFoundError:
+                pass
+            else:
+                if self._last_write[1:] == (st.st_mtime_ns, st.st_size):
+                    return
+
+        # Для симлинка заменяем файл, на который он указывает, а не сам симлинк
+        target = os.path.realpath(self.cfg_path)
+        parent = os.path.dirname(target)
+        os.makedirs(parent, exist_ok=True)
+        try:
+            mode: Optional[int] = stat.S_IMODE(os.stat(target).st_mode)
+        except FileNotFoundError:
+            mode = None
+
+        # Уникальное имя, чтобы параллельные записи не затирали временные файлы
+        fd, tmp_path = _open_temp_file(target)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            if mode is not None:
+                # Сохраняем права существующего файла конфигурации
+                os.chmod(tmp_path, mode)
+            os.replace(tmp_path, target)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        _fsync_dir(parent)
+
+        st = os.stat(self.cfg_path)
+        self._last_write = (digest, st.st_mtime_ns, st.st_size)
 
     @staticmethod
     def read_config(cfg_path: str) -> Dict[str, Any]:
@@ -93,12 +276,22 @@ class ConfigManager:
         Returns:
             Dict[str, Any]: Словарь с конфигурационными данными
 
+        Разобранный файл кэшируется по (путь, st_mtime_ns, st_size), а вызывающий
+        получает собственную копию словаря. Ограничение: на файловых системах
+        с грубым разрешением mtime перезапись файла тем же объемом данных
+        в пределах одного тика времени не будет замечена, и вернется
+        прежнее содержимое.
+
         Raises:
             FileNotFoundError: Если файл не существует
             JSONDecodeError: При некорректном формате JSON
         """
-        with open(cfg_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        abs_path = os.path.abspath(cfg_path)
+        st = os.stat(abs_path)
+        cfg: Dict[str, Any] = _copy_json(
+            _read_cached(abs_path, st.st_mtime_ns, st.st_size)
+        )
+        return cfg
 
     def get_volumes(self, base_container_path: str = "workspace") -> Dict[str, str]:
         """Формирует маппинг директорий для Docker-контейнера.
@@ -119,14 +312,7 @@ class ConfigManager:
         Raises:
             OSError: При ошибках обработки путей
         """
-        volumes = {}
-        for dir_type in ["data_dirs", "system_dirs"]:
-            for dir_name, host_path in self.cfg.get(dir_type, {}).items():
-                container_path = os.path.join(
-                    "/", base_container_path, dir_type, dir_name
-                )
-                volumes[host_path] = container_path
-        return volumes
+        return self._build_mappings(base_container_path)[0]
 
     def get_container_config(self) -> Dict[str, Any]:
         """Возвращает конфигурацию с путями внутри Docker-контейнера.
@@ -135,15 +321,42 @@ class ConfigManager:
         Returns:
             Dict[str, Any]: Конфигурация с путями контейнера
         """
-        container_cfg = {}
-        for dir_type in ["data_dirs", "system_dirs"]:
-            if dir_type in self.cfg:
-                container_cfg[dir_type] = {}
-                # Итерируемся только по ключам (dir_name), так как host_path не нужен
-                for dir_name in self.cfg[dir_type]:
-                    container_dir = os.path.join("/", "workspace", dir_type, dir_name)
-                    container_cfg[dir_type][dir_name] = container_dir
-        return container_cfg
+        return self._build_mappings()[1]
+
+    def _build_mappings(
+        self, base_container_path: str = "workspace"
+    ) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """Строит маппинг томов и конфигурацию контейнера за один проход по self.cfg.
+
+        Args:
+            base_container_path (str): Базовый путь внутри контейнера.
+                По умолчанию "workspace".
+
+        Returns:
+            Tuple[Dict[str, str], Dict[str, Any]]: Маппинг директорий
+            (хост -> контейнер) и конфигурация с путями контейнера.
+        """
+        # Пути внутри контейнера всегда POSIX, поэтому os.path.join не нужен
+        base = base_container_path.strip("/")
+        root = f"/{base}" if base else ""
+        cfg = self.cfg
+        sections = [
+            (dir_type, cfg[dir_type]) for dir_type in _DIR_TYPES if dir_type in cfg
+        ]
+        prefixes = {dir_type: f"{root}/{dir_type}" for dir_type, _ in sections}
+        container_cfg: Dict[str, Any] = {dir_type: {} for dir_type, _ in sections}
+        # Плоский список (dir_type, dir_name, host_path) по текущему состоянию cfg
+        entries = [
+            (dir_type, dir_name, host_path)
+            for dir_type, section in sections
+            for dir_name, host_path in section.items()
+        ]
+        volumes = {}
+        for dir_type, dir_name, host_path in entries:
+            container_path = f"{prefixes[dir_type]}/{dir_name}"
+            volumes[host_path] = container_path
+            container_cfg[dir_type][dir_name] = container_path
+        return volumes, container_cfg
 
     def load_packages(self, package_type: str) -> List[str]:
         """
@@ -165,10 +378,75 @@ class ConfigManager:
         file_key = f"{package_type}_packages"
         file_path = self.cfg.get(file_key)
 
-        if not file_path or not os.path.exists(file_path):
+        if not file_path:
             raise FileNotFoundError(f"Файл {file_path} не найден")
 
-        with open(file_path, "r") as f:
-            packages = [line.strip() for line in f if line.strip()]
+        try:
+            text = Path(file_path).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Файл {file_path} не найден") from None
+        return [pkg for line in text.splitlines() if (pkg := line.strip())]
+
+    def load_all_packages(
+        self, executor: Optional[Executor] = None
+    ) -> Dict[str, List[str]]:
+        """Загружает списки пакетов для всех этапов работы.
+
+        По умолчанию файлы требований читаются последовательно: на локальном
+        диске это быстрее, чем запуск потоков. На медленных файловых системах
+        (например, NFS) можно передать общий executor для параллельного чтения.
+
+        Args:
+            executor (Optional[Executor]): Пул для параллельного чтения файлов.
+                По умолчанию None (последовательное чтение).
+
+        Returns:
+            Dict[str, List[str]]: Словарь вида {"vlm_run": [...], "eval_run": [...]}
+
+        Raises:
+            FileNotFoundError: Если один из файлов требований не найден
+        """
+        package_types = ("vlm_run", "eval_run")
+        if executor is None:
+            return {
+                package_type: self.load_packages(package_type)
+                for package_type in package_types
+            }
+        results = executor.map(self.load_packages, package_types)
+        return dict(zip(package_types, results))
+
+
+# Кэш экземпляров ConfigManager: (abspath, default) -> (st_mtime_ns, экземпляр)
+_instances: Dict[Tuple[str, bool], Tuple[Optional[int], ConfigManager]] = {}
+
+
+def get_config_manager(cfg_path: str, default: bool = False) -> ConfigManager:
+    """Возвращает общий экземпляр ConfigManager для указанного файла конфигурации.
+
+    Повторные вызовы с теми же аргументами возвращают уже созданный экземпляр,
+    пока файл конфигурации не изменится (проверяется по st_mtime_ns). Экземпляр
+    общий для всех вызывающих, поэтому изменять его cfg следует с осторожностью.
+
+    Args:
+        cfg_path (str): Путь к файлу конфигурации
+        default (bool, optional): Флаг для инициализации конфига по умолчанию.
+            По умолчанию False.
+
+    Returns:
+        ConfigManager: Экземпляр менеджера конфигурации
+
+    Raises:
+        FileNotFoundError: Если файл не найден при default=False
+    """
+    abs_path = os.path.abspath(cfg_path)
+    # Конфиг по умолчанию не зависит от содержимого файла
+    mtime_ns = None if default else os.stat(abs_path).st_mtime_ns
+    key = (abs_path, default)
+
+    cached = _instances.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
 
-        return packages
+    manager = ConfigManager(cfg_path, default)
+    _instances[key] = (mtime_ns, manager)
+    return manager
@@ -19,13 +19,9 @@ if __name__ == "__main__":
     print(config.cfg_container)
 
     # Получим список python-пакетов для каждого этапа работы
-    vlm_run_packages = config.load_packages("vlm_run")
-    eval_run_packages = config.load_packages("eval_run")
-    
-    print("vlm_run_packages:")
-    for package in vlm_run_packages:
-        print(package)
-        
-    print("eval_run_packages:")
-    for package in eval_run_packages:
-        print(package)
+    packages = config.load_all_packages()
+
+    for package_type, package_list in packages.items():
+        print(f"{package_type}_packages:")
+        for package in package_list:
+            print(package)
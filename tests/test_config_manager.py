@@ -0,0 +1,348 @@
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from config_manager.config_manager import ConfigManager, get_config_manager
+
+
+def _baseline_volumes(cfg, base_container_path="workspace"):
+    """Маппинг томов так, как его строила исходная реализация get_volumes."""
+    volumes = {}
+    for dir_type in ["data_dirs", "system_dirs"]:
+        for dir_name, host_path in cfg.get(dir_type, {}).items():
+            volumes[host_path] = os.path.join(
+                "/", base_container_path, dir_type, dir_name
+            )
+    return volumes
+
+
+def _baseline_container_config(cfg):
+    """Конфигурация контейнера так, как её строила исходная get_container_config."""
+    container_cfg = {}
+    for dir_type in ["data_dirs", "system_dirs"]:
+        if dir_type in cfg:
+            container_cfg[dir_type] = {
+                dir_name: os.path.join("/", "workspace", dir_type, dir_name)
+                for dir_name in cfg[dir_type]
+            }
+    return container_cfg
+
+
+def _write_json(path, cfg, mtime_ns=None):
+    """Пишет JSON в обход ConfigManager и при необходимости выставляет mtime."""
+    path.write_text(json.dumps(cfg), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_mappings_with_missing_section():
+    manager = ConfigManager("config.json", default=True)
+    del manager.cfg["system_dirs"]
+
+    assert manager.volumes == _baseline_volumes(manager.cfg)
+    assert manager.get_volumes() == _baseline_volumes(manager.cfg)
+    assert manager.cfg_container == _baseline_container_config(manager.cfg)
+
+
+def test_get_volumes_follows_cfg_edits_after_first_access():
+    manager = ConfigManager("config.json", default=True)
+    manager.volumes
+
+    manager.cfg["data_dirs"]["extra"] = "host/extra"
+    del manager.cfg["system_dirs"]
+
+    assert manager.get_volumes() == _baseline_volumes(manager.cfg)
+
+    manager.cfg = {"data_dirs": {"datasets": "host/datasets"}}
+
+    assert manager.get_volumes() == {"host/datasets": "/workspace/data_dirs/datasets"}
+
+
+def test_get_container_config_returns_fresh_dict():
+    manager = ConfigManager("config.json", default=True)
+
+    container_cfg = manager.get_container_config()
+    container_cfg["data_dirs"]["leaked"] = "/leaked"
+
+    assert "leaked" not in manager.get_container_config()["data_dirs"]
+    assert "leaked" not in manager.cfg_container["data_dirs"]
+
+
+def test_get_container_config_follows_cfg_edits():
+    manager = ConfigManager("config.json", default=True)
+    manager.cfg_container
+
+    manager.cfg["system_dirs"]["extra"] = "host/extra"
+
+    assert manager.get_container_config() == _baseline_container_config(manager.cfg)
+
+
+@pytest.mark.parametrize(
+    "base_container_path", ["workspace", "", "/workspace/", "a/b", "/"]
+)
+def test_get_volumes_matches_os_path_join(base_container_path):
+    manager = ConfigManager("config.json", default=True)
+
+    assert manager.get_volumes(base_container_path) == _baseline_volumes(
+        manager.cfg, base_container_path
+    )
+
+
+posix_only = pytest.mark.skipif(os.name != "posix", reason="POSIX-права и симлинки")
+
+
+@posix_only
+def test_write_config_applies_current_umask_to_new_file(tmp_path):
+    cfg_path = tmp_path / "config.json"
+    old_umask = os.umask(0o027)
+    try:
+        ConfigManager(str(cfg_path), default=True).write_config()
+    finally:
+        os.umask(old_umask)
+
+    assert os.stat(cfg_path).st_mode & 0o777 == 0o640
+
+
+@posix_only
+def test_write_config_keeps_existing_mode_and_symlink(tmp_path):
+    real_path = tmp_path / "real.json"
+    link_path = tmp_path / "link.json"
+    ConfigManager(str(real_path), default=True).write_config()
+    os.chmod(real_path, 0o600)
+    link_path.symlink_to("real.json")
+
+    manager = ConfigManager(str(link_path))
+    manager.cfg["extra"] = "value"
+    manager.write_config()
+
+    assert link_path.is_symlink()
+    assert os.stat(real_path).st_mode & 0o777 == 0o600
+    assert ConfigManager.read_config(str(real_path))["extra"] == "value"
+    assert sorted(os.listdir(tmp_path)) == ["link.json", "real.json"]
+
+
+def test_write_config_skips_identical_bytes(tmp_path):
+    cfg_path = tmp_path / "config.json"
+    manager = ConfigManager(str(cfg_path), default=True)
+    manager.write_config()
+    before = os.stat(cfg_path)
+
+    manager.write_config()
+
+    after = os.stat(cfg_path)
+    # Настоящая запись заменила бы файл новым inode через os.replace
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+
+
+def test_write_config_rewrites_after_external_change(tmp_path):
+    cfg_path = tmp_path / "config.json"
+    manager = ConfigManager(str(cfg_path), default=True)
+    manager.write_config()
+    expected = cfg_path.read_bytes()
+
+    # Тот же размер, другое содержимое и mtime
+    cfg_path.write_bytes(expected.replace(b"Datasets", b"DATASETS"))
+    os.utime(cfg_path, ns=(0, os.stat(cfg_path).st_mtime_ns + 10**9))
+
+    manager.write_config()
+
+    assert cfg_path.read_bytes() == expected
+
+
+def test_write_config_rewrites_after_file_removed(tmp_path):
+    cfg_path = tmp_path / "config.json"
+    manager = ConfigManager(str(cfg_path), default=True)
+    manager.write_config()
+    cfg_path.unlink()
+
+    manager.write_config()
+
+    assert cfg_path.exists()
+
+
+def test_write_config_creates_missing_parent_dirs(tmp_path):
+    cfg_path = tmp_path / "a" / "b" / "config.json"
+
+    ConfigManager(str(cfg_path), default=True).write_config()
+
+    assert ConfigManager.read_config(str(cfg_path)) == ConfigManager.get_default_config()
+
+
+def test_get_config_manager_reuses_instance_until_mtime_changes(tmp_path):
+    cfg_path = tmp_path / "config.json"
+    _write_json(cfg_path, {"value": 1}, mtime_ns=10**18)
+
+    first = get_config_manager(str(cfg_path))
+    assert get_config_manager(str(cfg_path)) is first
+
+    _write_json(cfg_path, {"value": 2}, mtime_ns=10**18 + 10**9)
+    reloaded = get_config_manager(str(cfg_path))
+
+    assert reloaded is not first
+    assert reloaded.cfg == {"value": 2}
+    assert get_config_manager(str(cfg_path)) is reloaded
+
+
+def test_get_config_manager_keeps_default_and_file_instances_apart(tmp_path):
+    cfg_path = tmp_path / "config.json"
+    _write_json(cfg_path, {"value": 1})
+
+    from_file = get_config_manager(str(cfg_path))
+    default = get_config_manager(str(cfg_path), default=True)
+
+    assert default is not from_file
+    assert default.cfg == ConfigManager.get_default_config()
+    assert get_config_manager(str(cfg_path), default=True) is default
+
+
+def test_read_config_reloads_after_mtime_change(tmp_path):
+    cfg_path = tmp_path / "config.json"
+    _write_json(cfg_path, {"value": 1}, mtime_ns=10**18)
+    assert ConfigManager.read_config(str(cfg_path)) == {"value": 1}
+
+    # Размер файла не меняется, кэш должен сброситься только по mtime
+    _write_json(cfg_path, {"value": 2}, mtime_ns=10**18 + 10**9)
+
+    assert ConfigManager.read_config(str(cfg_path)) == {"value": 2}
+
+
+def test_read_config_returns_independent_copies(tmp_path):
+    cfg_path = tmp_path / "config.json"
+    original = {"data_dirs": {"datasets": "data"}, "items": [{"name": "a"}]}
+    _write_json(cfg_path, original)
+
+    cfg = ConfigManager.read_config(str(cfg_path))
+    cfg["data_dirs"]["datasets"] = "changed"
+    cfg["items"][0]["name"] = "changed"
+    cfg["extra"] = 1
+
+    assert ConfigManager.read_config(str(cfg_path)) == original
+
+
+def _manager_with_packages(tmp_path, **files):
+    """ConfigManager с файлами требований, записанными в tmp_path."""
+    manager = ConfigManager(str(tmp_path / "config.json"), default=True)
+    for package_type, text in files.items():
+        path = tmp_path / f"{package_type}_requirements.txt"
+        path.write_text(text, encoding="utf-8")
+        manager.cfg[f"{package_type}_packages"] = str(path)
+    return manager
+
+
+def test_load_packages_skips_blank_lines_and_strips(tmp_path):
+    manager = _manager_with_packages(
+        tmp_path, vlm_run="  pkg-a  \n\n   \npkg-b\r\n\npkg-c"
+    )
+
+    assert manager.load_packages("vlm_run") == ["pkg-a", "pkg-b", "pkg-c"]
+
+
+def test_load_packages_missing_key_raises_file_not_found(tmp_path):
+    manager = _manager_with_packages(tmp_path)
+    del manager.cfg["vlm_run_packages"]
+
+    with pytest.raises(FileNotFoundError, match="не найден"):
+        manager.load_packages("vlm_run")
+
+
+def test_load_packages_missing_file_raises_file_not_found(tmp_path):
+    manager = _manager_with_packages(tmp_path)
+    missing = tmp_path / "missing.txt"
+    manager.cfg["eval_run_packages"] = str(missing)
+
+    with pytest.raises(FileNotFoundError, match=re.escape(f"Файл {missing} не найден")):
+        manager.load_packages("eval_run")
+
+
+def test_load_packages_rejects_unknown_type(tmp_path):
+    manager = _manager_with_packages(tmp_path)
+
+    with pytest.raises(ValueError):
+        manager.load_packages("unknown")
+
+
+def test_load_all_packages_serial_and_with_executor(tmp_path):
+    manager = _manager_with_packages(tmp_path, vlm_run="pkg-a\n", eval_run="pkg-b\n")
+    expected = {"vlm_run": ["pkg-a"], "eval_run": ["pkg-b"]}
+
+    assert manager.load_all_packages() == expected
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert manager.load_all_packages(executor) == expected
+
+
+def test_load_all_packages_propagates_missing_file(tmp_path):
+    manager = _manager_with_packages(tmp_path, vlm_run="pkg-a\n")
+    manager.cfg["eval_run_packages"] = str(tmp_path / "missing.txt")
+
+    with pytest.raises(FileNotFoundError):
+        manager.load_all_packages()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(FileNotFoundError):
+            manager.load_all_packages(executor)
+
+
+def test_get_default_config_returns_independent_nested_dicts():
+    first = ConfigManager.get_default_config()
+    first["data_dirs"]["datasets"] = "changed"
+    first["system_dirs"]["extra"] = "added"
+    first["user_config"] = "changed"
+
+    second = ConfigManager.get_default_config()
+
+    assert second["data_dirs"]["datasets"] == "vlmhyperbench/data_dirs/Datasets"
+    assert "extra" not in second["system_dirs"]
+    assert second["user_config"] == "user_config_prompt_eval.csv"
+
+
+def test_volumes_and_cfg_container_are_assignable():
+    manager = ConfigManager("config.json", default=True)
+    expected_container = manager.get_container_config()
+
+    manager.volumes = {"host": "/container"}
+
+    assert manager.volumes == {"host": "/container"}
+    assert manager.cfg_container == expected_container
+
+    manager.cfg_container = {"data_dirs": {}}
+
+    assert manager.cfg_container == {"data_dirs": {}}
+    assert manager.volumes == {"host": "/container"}
+
+
+def test_mappings_empty_without_directory_sections():
+    manager = ConfigManager("config.json", default=True)
+    manager.cfg = {"user_config": "user_config_prompt_eval.csv"}
+
+    assert manager.volumes == {}
+    assert manager.cfg_container == {}
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        '{"value": NaN}',
+        '{"value": Infinity}',
+        '{"value": 1e400}',
+        '{"value": 123456789012345678901234567890}',
+        '{"value": -9223372036854775809}',
+        '{"value": [1, 2.5, "x", null]}',
+    ],
+)
+def test_read_config_matches_stdlib_json(tmp_path, document):
+    cfg_path = tmp_path / "config.json"
+    cfg_path.write_text(document, encoding="utf-8")
+
+    assert repr(ConfigManager.read_config(str(cfg_path))) == repr(json.loads(document))
+
+
+def test_write_config_keeps_integers_beyond_64_bits(tmp_path):
+    cfg_path = tmp_path / "config.json"
+    manager = ConfigManager(str(cfg_path), default=True)
+    manager.cfg["big"] = 2**70
+
+    manager.write_config()
+
+    assert ConfigManager.read_config(str(cfg_path))["big"] == 2**70